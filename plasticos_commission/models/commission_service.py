@@ -6,6 +6,16 @@ class PlasticosCommissionService(models.AbstractModel):
     _description = "Commission Service"
 
     def compute_commission(self, transaction):
-        if transaction.commission_rule_id:
-            return transaction.gross_margin * transaction.commission_rule_id.percentage
-        return 0.0
+        return self.compute_commission_multi(transaction)[transaction.id]
+
+    def compute_commission_multi(self, transactions):
+        pct_by_rule = {
+            rule.id: rule.percentage for rule in transactions.commission_rule_id
+        }
+        return {
+            tx.id: (
+                tx.gross_margin * pct_by_rule[tx.commission_rule_id.id]
+                if tx.commission_rule_id else 0.0
+            )
+            for tx in transactions
+        }
@@ -29,5 +29,29 @@ class PlasticosComplianceService(models.AbstractModel):
         return missing
 
     def is_compliant(self, res_model, res_id):
-        missing = self.get_missing_documents(res_model, res_id)
-        return len(missing) == 0
+        return res_id in self.is_compliant_multi(res_model, [res_id])
+
+    def is_compliant_multi(self, res_model, res_ids):
+        rules = self.env["plasticos.document.rule"].search([
+            ("res_model", "=", res_model),
+            ("active", "=", True)
+        ])
+        required_tag_ids = rules.tag_id.ids
+        if not required_tag_ids:
+            return set(res_ids)
+
+        self.env["plasticos.document"].flush_model(
+            ["res_model", "res_id", "tag_id", "verified", "override", "active"]
+        )
+        self.env.cr.execute("""
+            SELECT res_id
+            FROM plasticos_document
+            WHERE res_model = %s
+              AND res_id = ANY(%s)
+              AND tag_id = ANY(%s)
+              AND active
+              AND (verified OR override)
+            GROUP BY res_id
+            HAVING count(DISTINCT tag_id) = %s
+        """, (res_model, list(res_ids), required_tag_ids, len(required_tag_ids)))
+        return {row[0] for row in self.env.cr.fetchall()}
@@ -23,6 +23,15 @@ class PlasticosDocument(models.Model):
 
     active = fields.Boolean(default=True)
 
+    def init(self):
+        super().init()
+        # Covers the compliance lookup so it is answered from the index alone.
+        self.env.cr.execute("""
+            CREATE INDEX IF NOT EXISTS plasticos_document_res_tag_idx
+            ON plasticos_document (res_model, res_id, tag_id)
+            INCLUDE (verified, override, active)
+        """)
+
     @api.model
     def create(self, vals):
         record = super().create(vals)
@@ -27,12 +27,11 @@ class PlasticosDispatch(models.Model):
     ], default="quoted")
 
     def action_transition(self, new_state):
-        for rec in self:
-            correlation_id = new_correlation_id()
-            old_state = rec.state
-            rec.state = new_state
-            # Log state transition (l9_trace integration disabled)
-            _logger.info(
-                "Dispatch %s state transition: %s -> %s (correlation: %s)",
-                rec.id, old_state, new_state, correlation_id
-            )
+        correlation_id = new_correlation_id()
+        old_states = self.mapped("state")
+        self.write({"state": new_state})
+        # Log state transition (l9_trace integration disabled)
+        _logger.info(
+            "Dispatch %s state transition: %s -> %s (correlation: %s)",
+            self.ids, old_states, new_state, correlation_id
+        )
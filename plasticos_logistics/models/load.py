@@ -1,5 +1,6 @@
 from odoo import models, fields, api
 from odoo.exceptions import UserError
+from odoo.tools.sql import create_index
 import uuid
 import logging
 
@@ -14,6 +15,14 @@ def new_correlation_id():
     return str(uuid.uuid4())
 
 
+LANE_FIELDS = frozenset({"origin_zip", "destination_zip"})
+LANE_LOCKED_STATES = frozenset({
+    "rate_confirmed", "scheduled", "dispatched", "picked_up", "delivered", "closed",
+})
+DISPATCH_LOCKED_STATES = frozenset({"dispatched", "picked_up", "delivered", "closed"})
+POST_DISPATCH_FIELDS = frozenset({"bol_pickup_attached", "bol_delivery_attached"})
+
+
 class PlasticosLoad(models.Model):
     _name = "plasticos.load"
     _description = "Plasticos Logistics Load"
@@ -54,15 +63,21 @@ class PlasticosLoad(models.Model):
         ("exception", "Exception"),
     ], default="draft", tracking=True)
 
+    def init(self):
+        super().init()
+        create_index(
+            self.env.cr,
+            "plasticos_load_state_entered_idx",
+            self._table,
+            ["state", "entered_state_at"],
+        )
+
     def write(self, vals):
-        for rec in self:
-            if rec.state in ["rate_confirmed", "scheduled", "dispatched", "picked_up", "delivered", "closed"]:
-                if any(f in vals for f in ["origin_zip", "destination_zip"]):
-                    raise UserError("Lane cannot be modified after rate confirmation.")
-            if rec.state in ["dispatched", "picked_up", "delivered", "closed"]:
-                blocked = set(vals.keys()) - {"bol_pickup_attached", "bol_delivery_attached"}
-                if blocked:
-                    raise UserError("Load locked after dispatch.")
+        states = set(self.mapped("state"))
+        if not LANE_LOCKED_STATES.isdisjoint(states) and not LANE_FIELDS.isdisjoint(vals):
+            raise UserError("Lane cannot be modified after rate confirmation.")
+        if not DISPATCH_LOCKED_STATES.isdisjoint(states) and set(vals) - POST_DISPATCH_FIELDS:
+            raise UserError("Load locked after dispatch.")
         return super().write(vals)
 
     @api.depends("dispatched_at", "delivered_at")
@@ -75,18 +90,20 @@ class PlasticosLoad(models.Model):
                 rec.cycle_time_hours = 0
 
     def action_confirm_ready(self, user_name):
+        now = fields.Datetime.now()
         for rec in self:
             rec.ready_confirmed_by = user_name
-            rec.ready_confirmed_at = fields.Datetime.now()
+            rec.ready_confirmed_at = now
             rec._transition("ready_confirmed")
 
     def action_confirm_rate(self, rate):
-        for rec in self:
-            rec.rate_amount = rate
-            rec.rate_confirmed_at = fields.Datetime.now()
-            rec.rate_auto_reused = False
-            rec._transition("rate_confirmed")
-            rec._store_rate_memory()
+        self.write({
+            "rate_amount": rate,
+            "rate_confirmed_at": fields.Datetime.now(),
+            "rate_auto_reused": False,
+        })
+        self._transition("rate_confirmed")
+        self._store_rate_memory()
 
     def action_schedule(self, pickup_dt, delivery_dt):
         for rec in self:
@@ -107,28 +124,36 @@ class PlasticosLoad(models.Model):
             rec._transition("closed")
 
     def _transition(self, new_state):
-        for rec in self:
-            correlation_id = new_correlation_id()
-            old = rec.state
-            vals = {"state": new_state, "entered_state_at": fields.Datetime.now()}
-            if new_state == "dispatched":
-                vals["dispatched_at"] = fields.Datetime.now()
-            if new_state == "delivered":
-                vals["delivered_at"] = fields.Datetime.now()
-            rec.write(vals)
-            # Log state transition (l9_trace integration disabled)
-            _logger.info(
-                "Load %s state transition: %s -> %s (correlation: %s)",
-                rec.id, old, new_state, correlation_id
-            )
+        correlation_id = new_correlation_id()
+        old_states = self.mapped("state")
+        now = fields.Datetime.now()
+        vals = {"state": new_state, "entered_state_at": now}
+        if new_state == "dispatched":
+            vals["dispatched_at"] = now
+        if new_state == "delivered":
+            vals["delivered_at"] = now
+        self.write(vals)
+        # Log state transition (l9_trace integration disabled)
+        _logger.info(
+            "Load %s state transition: %s -> %s (correlation: %s)",
+            self.ids, old_states, new_state, correlation_id
+        )
 
     def _store_rate_memory(self):
-        self.env["plasticos.rate.memory"].create({
-            "carrier_id": self.carrier_id.id,
-            "lane_key": self._lane_key(),
-            "rate_amount": self.rate_amount,
-            "rate_date": fields.Date.today(),
-        })
+        today = fields.Date.today()
+        lane_keys = {}
+        vals_list = []
+        for rec in self:
+            so_id = rec.sale_order_id.id
+            if so_id not in lane_keys:
+                lane_keys[so_id] = rec._lane_key()
+            vals_list.append({
+                "carrier_id": rec.carrier_id.id,
+                "lane_key": lane_keys[so_id],
+                "rate_amount": rec.rate_amount,
+                "rate_date": today,
+            })
+        return self.env["plasticos.rate.memory"].create(vals_list)
 
     def _lane_key(self):
         so = self.sale_order_id
@@ -1,3 +1,5 @@
+from datetime import timedelta
+
 from odoo import fields
 
 
@@ -12,16 +14,17 @@ ESCALATION_HOURS = {
 
 def check_escalations(env):
     now = fields.Datetime.now()
-    loads = env["plasticos.load"].search([
-        ("state", "in", list(ESCALATION_HOURS.keys()))
-    ])
+    # One (state, entered_state_at) branch per state so the age check is
+    # answered by the composite index instead of in Python.
+    domain = ["|"] * (len(ESCALATION_HOURS) - 1)
+    for state, limit in ESCALATION_HOURS.items():
+        domain += [
+            "&",
+            ("state", "=", state),
+            ("entered_state_at", "<", now - timedelta(hours=limit)),
+        ]
+    loads = env["plasticos.load"].search(domain)
+    loads.sla_breached = True
     for load in loads:
-        if not load.entered_state_at:
-            continue
-        limit = ESCALATION_HOURS.get(load.state)
-        if not limit:
-            continue
-        delta = (now - load.entered_state_at).total_seconds() / 3600
-        if delta > limit:
-            load.sla_breached = True
-            load.message_post(body=f"SLA breach: stuck in {load.state} > {limit}h")
+        limit = ESCALATION_HOURS[load.state]
+        load.message_post(body=f"SLA breach: stuck in {load.state} > {limit}h")
@@ -1,10 +1,18 @@
-VALID_TRANSITIONS = {
-    "draft": ["awaiting_ready"],
-    "awaiting_ready": ["ready_confirmed"],
-    "ready_confirmed": ["rate_confirmed"],
-    "rate_confirmed": ["scheduled"],
-    "scheduled": ["dispatched"],
-    "dispatched": ["picked_up"],
-    "picked_up": ["delivered"],
-    "delivered": ["closed"],
-}
+from types import MappingProxyType
+
+VALID_TRANSITIONS = MappingProxyType({
+    "draft": frozenset({"awaiting_ready"}),
+    "awaiting_ready": frozenset({"ready_confirmed"}),
+    "ready_confirmed": frozenset({"rate_confirmed"}),
+    "rate_confirmed": frozenset({"scheduled"}),
+    "scheduled": frozenset({"dispatched"}),
+    "dispatched": frozenset({"picked_up"}),
+    "picked_up": frozenset({"delivered"}),
+    "delivered": frozenset({"closed"}),
+})
+
+_NO_TRANSITIONS = frozenset()
+
+
+def can_transition(current_state, new_state):
+    return new_state in VALID_TRANSITIONS.get(current_state, _NO_TRANSITIONS)
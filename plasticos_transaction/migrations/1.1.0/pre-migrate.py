@@ -1,17 +1,79 @@
-def migrate(cr, version):
-    # Backfill missing sequence names
+from psycopg2.extras import execute_values
+
+
+def _env(cr):
+    from odoo import api, SUPERUSER_ID
+    return api.Environment(cr, SUPERUSER_ID, {})
+
+
+def _backfill_by_code(cr):
+    # Sequences whose numbering lives outside number_next (standard PG
+    # sequence, date ranges) go through next_by_code; names are still
+    # written back in a single round-trip.
+    env = _env(cr)
+
     cr.execute("""
         SELECT id FROM plasticos_transaction
-        WHERE name = 'New';
+        WHERE name = 'New'
+        ORDER BY id;
     """)
     ids = [row[0] for row in cr.fetchall()]
+    names = [env["ir.sequence"].next_by_code("plasticos.transaction") for _ in ids]
+    execute_values(cr, """
+        UPDATE plasticos_transaction t
+        SET name = v.name
+        FROM (VALUES %s) AS v(id, name)
+        WHERE t.id = v.id
+    """, list(zip(ids, names)), page_size=1000)
 
-    from odoo import api, SUPERUSER_ID
-    env = api.Environment(cr, SUPERUSER_ID, {})
 
-    for tx_id in ids:
-        seq = env["ir.sequence"].next_by_code("plasticos.transaction")
-        env["plasticos.transaction"].browse(tx_id).write({"name": seq})
+def migrate(cr, version):
+    # Backfill missing sequence names in one set-based UPDATE
+    cr.execute("""
+        SELECT count(*) FROM plasticos_transaction
+        WHERE name = 'New';
+    """)
+    count = cr.fetchone()[0]
+
+    sequence = None
+    if count:
+        cr.execute("""
+            SELECT id, padding, number_increment,
+                   implementation, use_date_range
+            FROM ir_sequence
+            WHERE code = 'plasticos.transaction'
+            ORDER BY company_id
+            LIMIT 1
+            FOR UPDATE;
+        """)
+        sequence = cr.fetchone()
+
+    if sequence and (sequence[3] != "no_gap" or sequence[4]):
+        _backfill_by_code(cr)
+    elif sequence:
+        seq_id, padding, step = sequence[:3]
+        # Reserve the whole block on the no_gap sequence row up front
+        cr.execute("""
+            UPDATE ir_sequence
+            SET number_next = number_next + %s
+            WHERE id = %s
+            RETURNING number_next - %s;
+        """, (step * count, seq_id, step * count))
+        first = cr.fetchone()[0]
+
+        # Let ir.sequence interpolate prefix/suffix itself so every
+        # placeholder it supports is honoured.
+        prefix, suffix = _env(cr)["ir.sequence"].browse(seq_id)._get_prefix_suffix()
+        cr.execute("""
+            UPDATE plasticos_transaction t
+            SET name = %s || lpad(s.number::text, greatest(%s, length(s.number::text)), '0') || %s
+            FROM (
+                SELECT id, %s + (row_number() OVER (ORDER BY id) - 1) * %s AS number
+                FROM plasticos_transaction
+                WHERE name = 'New'
+            ) s
+            WHERE t.id = s.id;
+        """, (prefix, padding, suffix, first, step))
 
     cr.execute("""
         UPDATE plasticos_transaction
@@ -1,5 +1,6 @@
 from odoo import models
 from odoo.exceptions import UserError
+from odoo.tools.sql import create_index
 
 
 class AccountMove(models.Model):
@@ -9,6 +10,25 @@ class AccountMove(models.Model):
     #   before setting customer_invoice_id. Prevents posting customer invoice if tx missing docs.
     # button_cancel: prevent cancelling a move that is linked to a closed transaction
     #   (audit integrity: closed tx must not have its invoices/bills undone).
+    # init: partial indexes backing the in_invoice/out_invoice domains of the
+    #   transaction invoice/bill links, so type-filtered lookups avoid a seq scan.
+
+    def init(self):
+        super().init()
+        create_index(
+            self.env.cr,
+            "account_move_in_invoice_id_idx",
+            self._table,
+            ["id"],
+            where="move_type = 'in_invoice'",
+        )
+        create_index(
+            self.env.cr,
+            "account_move_out_invoice_id_idx",
+            self._table,
+            ["id"],
+            where="move_type = 'out_invoice'",
+        )
 
     def button_cancel(self):
         for move in self:
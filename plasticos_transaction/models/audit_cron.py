@@ -6,11 +6,11 @@ class PlasticosAuditCron(models.Model):
 
     def run_monthly_audit(self):
         tx_model = self.env["plasticos.transaction"]
-        violations = tx_model.search([
+        has_violations = tx_model.search_count([
             ("state", "=", "closed"),
             "|",
             ("gross_margin", "<", 0),
             ("commission_locked", "=", False),
-        ])
-        if violations:
+        ], limit=1)
+        if has_violations:
             raise Exception("Audit violations detected in closed transactions.")
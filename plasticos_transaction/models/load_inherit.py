@@ -10,10 +10,11 @@ class PlasticosLoad(models.Model):
         res = super().write(vals)
 
         if "state" in vals and vals["state"] == "closed":
+            tx_by_load = {}
+            for tx in self.env["plasticos.transaction"].search([("load_id", "in", self.ids)]):
+                tx_by_load.setdefault(tx.load_id.id, tx)
             for rec in self:
-                tx = self.env["plasticos.transaction"].search(
-                    [("load_id", "=", rec.id)], limit=1
-                )
+                tx = tx_by_load.get(rec.id)
                 if tx:
                     tx.message_post(body="Logistics closed.")
 
@@ -9,13 +9,14 @@ class SaleOrder(models.Model):
     def action_confirm(self):
         res = super().action_confirm()
 
-        for rec in self:
-            if not rec.transaction_id:
-                transaction = self.env["plasticos.transaction"].create({
-                    "name": f"TX-{rec.name}",
-                    "sale_order_id": rec.id
-                })
+        need = self.filtered(lambda r: not r.transaction_id)
+        if need:
+            transactions = self.env["plasticos.transaction"].create([{
+                "name": f"TX-{rec.name}",
+                "sale_order_id": rec.id
+            } for rec in need])
+            for rec, transaction in zip(need, transactions):
                 rec.transaction_id = transaction.id
-                transaction.action_activate()
+            transactions.action_activate()
 
         return res
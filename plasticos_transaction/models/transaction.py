@@ -1,5 +1,19 @@
+from collections import defaultdict
+
 from odoo import models, fields, api
-from odoo.exceptions import UserError
+from odoo.addons.base.models.ir_sequence import _update_nogap
+from odoo.exceptions import UserError, ValidationError
+from odoo.tools.sql import create_index, create_unique_index, index_exists
+
+
+CLOSED_PROTECTED_FIELDS = frozenset({
+    "sale_order_id",
+    "purchase_order_ids",
+    "customer_invoice_id",
+    "vendor_bill_ids",
+    "freight_bill_ids",
+    "commission_rule_id",
+})
 
 
 class PlasticosTransaction(models.Model):
@@ -53,12 +67,48 @@ class PlasticosTransaction(models.Model):
         ("closed", "Closed")
     ], default="draft", tracking=True)
 
+    def init(self):
+        super().init()
+        for relation in ("plasticos_tx_vendor_rel", "plasticos_tx_freight_rel"):
+            index_name = f"{relation}_bill_uniq"
+            if index_exists(self.env.cr, index_name):
+                continue
+            # Report existing duplicates instead of failing the index DDL.
+            self.env.cr.execute(f"""
+                SELECT account_move_id
+                FROM {relation}
+                GROUP BY account_move_id
+                HAVING count(*) > 1
+            """)
+            move_ids = [row[0] for row in self.env.cr.fetchall()]
+            if move_ids:
+                raise UserError(
+                    f"Duplicate bill links detected in {relation} (account.move ids: "
+                    f"{', '.join(map(str, move_ids))}). Resolve manually before upgrade."
+                )
+            create_unique_index(
+                self.env.cr,
+                index_name,
+                relation,
+                ["account_move_id"],
+            )
+        create_index(
+            self.env.cr,
+            "plasticos_transaction_state_gross_margin_idx",
+            self._table,
+            ["state", "gross_margin"],
+        )
+
     @api.depends(
         "customer_invoice_id.amount_total",
         "vendor_bill_ids.amount_total",
         "freight_bill_ids.amount_total"
     )
     def _compute_financials(self):
+        # Read amount_total for every linked move in one query so the loop
+        # below only hits the cache.
+        moves = self.customer_invoice_id | self.vendor_bill_ids | self.freight_bill_ids
+        moves.mapped("amount_total")
         for rec in self:
             revenue = rec.customer_invoice_id.amount_total if rec.customer_invoice_id else 0.0
             vendor_cost = sum(rec.vendor_bill_ids.mapped("amount_total"))
@@ -71,93 +121,101 @@ class PlasticosTransaction(models.Model):
 
     @api.depends("gross_margin", "commission_rule_id", "state", "commission_locked", "commission_locked_amount")
     def _compute_commission(self):
-        service = self.env["plasticos.commission.service"]
+        unlocked = self.filtered(lambda t: not t.commission_locked)
+        amounts = self.env["plasticos.commission.service"].compute_commission_multi(unlocked)
         for rec in self:
             if rec.commission_locked:
                 rec.commission_amount = rec.commission_locked_amount or 0.0
                 continue
-            rec.commission_amount = service.compute_commission(rec)
+            rec.commission_amount = amounts[rec.id]
 
-    @api.depends("create_date")
     def _compute_compliance(self):
-        service = self.env["plasticos.compliance.service"]
+        compliant_ids = self.env["plasticos.compliance.service"].is_compliant_multi(
+            "plasticos.transaction", self.ids
+        )
         for rec in self:
-            if service.is_compliant("plasticos.transaction", rec.id):
+            if rec.id in compliant_ids:
                 rec.compliance_status = "compliant"
             else:
                 rec.compliance_status = "missing"
 
+    @api.constrains("customer_invoice_id", "vendor_bill_ids", "freight_bill_ids")
+    def _check_move_types(self):
+        # The field domains are only applied in the UI; enforce them here so
+        # _compute_financials can trust every linked move.
+        if self.customer_invoice_id.filtered(lambda m: m.move_type != "out_invoice"):
+            raise ValidationError("Customer invoice link must reference an out_invoice move.")
+        bills = self.vendor_bill_ids | self.freight_bill_ids
+        if bills.filtered(lambda m: m.move_type != "in_invoice"):
+            raise ValidationError("Vendor and freight bill links must reference in_invoice moves.")
+
     @api.model_create_multi
     def create(self, vals_list):
-        for vals in vals_list:
-            if vals.get("name", "New") == "New":
-                vals["name"] = (
-                    self.env["ir.sequence"].next_by_code("plasticos.transaction") or "New"
-                )
+        pending = [vals for vals in vals_list if vals.get("name", "New") == "New"]
+        if pending:
+            names = self._next_transaction_names(len(pending))
+            for vals, name in zip(pending, names):
+                vals["name"] = name or "New"
         return super().create(vals_list)
 
+    @api.model
+    def _next_transaction_names(self, count):
+        sequence_model = self.env["ir.sequence"]
+        sequence = sequence_model.sudo().search([
+            ("code", "=", "plasticos.transaction"),
+            ("company_id", "in", [self.env.company.id, False]),
+        ], order="company_id", limit=1)
+        if not sequence or sequence.implementation != "no_gap" or sequence.use_date_range:
+            return [sequence_model.next_by_code("plasticos.transaction") for _ in range(count)]
+        # Reserve the whole block with one locked row update instead of one
+        # next_by_code round-trip per record.
+        step = sequence.number_increment
+        first = _update_nogap(sequence, step * count)
+        return [sequence.get_next_char(first + i * step) for i in range(count)]
+
     def write(self, vals):
-        for rec in self:
-            if "state" in vals:
-                allow = (
-                    vals.get("state") == "active"
-                    or (vals.get("state") == "closed" and vals.get("commission_locked") is True)
-                )
-                if not allow:
-                    raise UserError("State can only be changed via action methods.")
-            if "name" in vals:
-                raise UserError("Transaction reference cannot be modified.")
-            if rec.state == "closed":
-                protected = {
-                    "sale_order_id",
-                    "purchase_order_ids",
-                    "customer_invoice_id",
-                    "vendor_bill_ids",
-                    "freight_bill_ids",
-                    "commission_rule_id",
-                }
-                if protected.intersection(vals.keys()):
+        if "state" in vals:
+            allow = (
+                vals.get("state") == "active"
+                or (vals.get("state") == "closed" and vals.get("commission_locked") is True)
+            )
+            if not allow:
+                raise UserError("State can only be changed via action methods.")
+        if "name" in vals:
+            raise UserError("Transaction reference cannot be modified.")
+
+        touches_protected = not CLOSED_PROTECTED_FIELDS.isdisjoint(vals)
+        touches_rule = "commission_rule_id" in vals
+        touches_invoice = "customer_invoice_id" in vals
+        if touches_protected or touches_rule or touches_invoice:
+            for rec in self:
+                if touches_protected and rec.state == "closed":
                     raise UserError("Closed transactions are immutable.")
-            if rec.commission_locked and "commission_rule_id" in vals:
-                raise UserError("Commission cannot be modified after lock.")
-            if rec.customer_invoice_id and "customer_invoice_id" in vals:
-                if vals["customer_invoice_id"] != rec.customer_invoice_id.id:
-                    raise UserError("Customer invoice cannot be reassigned once set.")
-            if "vendor_bill_ids" in vals:
-                for cmd in vals["vendor_bill_ids"]:
-                    if cmd[0] == 4:
-                        other = self.search([
-                            ("vendor_bill_ids", "in", [cmd[1]]),
-                            ("id", "!=", rec.id),
-                        ], limit=1)
-                        if other:
-                            raise UserError("Vendor bill already linked to another transaction.")
-                    elif cmd[0] == 6:
-                        for bid in cmd[2]:
-                            other = self.search([
-                                ("vendor_bill_ids", "in", [bid]),
-                                ("id", "!=", rec.id),
-                            ], limit=1)
-                            if other:
-                                raise UserError("Vendor bill already linked to another transaction.")
-            if "freight_bill_ids" in vals:
-                for cmd in vals["freight_bill_ids"]:
-                    if cmd[0] == 4:
-                        other = self.search([
-                            ("freight_bill_ids", "in", [cmd[1]]),
-                            ("id", "!=", rec.id),
-                        ], limit=1)
-                        if other:
-                            raise UserError("Freight bill already linked to another transaction.")
-                    elif cmd[0] == 6:
-                        for bid in cmd[2]:
-                            other = self.search([
-                                ("freight_bill_ids", "in", [bid]),
-                                ("id", "!=", rec.id),
-                            ], limit=1)
-                            if other:
-                                raise UserError("Freight bill already linked to another transaction.")
-        return super().write(vals)
+                if touches_rule and rec.commission_locked:
+                    raise UserError("Commission cannot be modified after lock.")
+                if touches_invoice and rec.customer_invoice_id:
+                    if vals["customer_invoice_id"] != rec.customer_invoice_id.id:
+                        raise UserError("Customer invoice cannot be reassigned once set.")
+        res = super().write(vals)
+        for field_name in ("vendor_bill_ids", "freight_bill_ids"):
+            if field_name in vals:
+                self._check_unique_bill_link(field_name)
+        return res
+
+    def _check_unique_bill_link(self, field_name):
+        # The unique index on the relation table keeps a single owner per
+        # bill; the ORM inserts links with ON CONFLICT DO NOTHING, so a link
+        # that lost to another transaction shows up as a foreign owner here.
+        # Within the batch only one record keeps the row in the database
+        # while the cache still shows the bill on each, so compare counts.
+        label = "Vendor" if field_name == "vendor_bill_ids" else "Freight"
+        if sum(len(rec[field_name]) for rec in self) != len(self[field_name]):
+            raise UserError(f"{label} bill linked to more than one transaction.")
+        if self.search_count([
+            (field_name, "in", self[field_name].ids),
+            ("id", "not in", self.ids),
+        ], limit=1):
+            raise UserError(f"{label} bill already linked to another transaction.")
 
     def unlink(self):
         for rec in self:
@@ -174,11 +232,19 @@ class PlasticosTransaction(models.Model):
         service_docs = self.env["plasticos.compliance.service"]
         service_commission = self.env["plasticos.commission.service"]
 
+        self.env.cr.execute(
+            "SELECT id FROM plasticos_transaction WHERE id = ANY(%s) FOR UPDATE",
+            (self.ids,),
+        )
+        # Load every state checked below in one read per model.
+        (self.customer_invoice_id | self.vendor_bill_ids).mapped("state")
+        self.load_id.mapped("state")
+        compliant_ids = service_docs.is_compliant_multi("plasticos.transaction", self.ids)
+        commissions = service_commission.compute_commission_multi(self)
+        is_manager = self.env.user.has_group("plasticos_transaction.group_plasticos_manager")
+
+        to_lock = defaultdict(list)
         for rec in self:
-            self.env.cr.execute(
-                "SELECT id FROM plasticos_transaction WHERE id = %s FOR UPDATE",
-                (rec.id,),
-            )
             if not rec.customer_invoice_id or rec.customer_invoice_id.state != "posted":
                 raise UserError("Customer invoice must be posted.")
 
@@ -188,17 +254,19 @@ class PlasticosTransaction(models.Model):
             if rec.load_id and rec.load_id.state != "closed":
                 raise UserError("Logistics must be closed.")
 
-            if not service_docs.is_compliant("plasticos.transaction", rec.id):
+            if rec.id not in compliant_ids:
                 raise UserError("Required documents missing.")
 
-            if not self.env.user.has_group("plasticos_transaction.group_plasticos_manager"):
+            if not is_manager:
                 raise UserError("Only Plasticos Managers can close transactions.")
 
             if rec.gross_margin < 0:
                 raise UserError("Cannot close transaction with negative gross margin.")
 
-            amount = service_commission.compute_commission(rec)
-            rec.write({
+            to_lock[commissions[rec.id]].append(rec.id)
+
+        for amount, ids in to_lock.items():
+            self.browse(ids).write({
                 "commission_locked_amount": amount,
                 "commission_locked": True,
                 "state": "closed",
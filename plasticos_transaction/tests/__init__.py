@@ -6,7 +6,6 @@ from . import test_domain_isolation
 from . import test_financial_audit
 from . import test_integrity_enforcement
 from . import test_migration
-from . import test_migration_safety
 from . import test_multi_currency
 from . import test_performance_scale
 from . import test_rpc_abuse
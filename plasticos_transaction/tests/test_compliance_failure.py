@@ -9,3 +9,126 @@ class TestComplianceFailure(TransactionCase):
         tx.action_activate()
         with self.assertRaises(Exception):
             tx.action_close()
+
+
+class TestComplianceMulti(TransactionCase):
+
+    @classmethod
+    def _get_or_create_account(cls, code, name, account_type, reconcile=False):
+        account = cls.env['account.account'].search([('code', '=', code)], limit=1)
+        if not account:
+            account = cls.env['account.account'].create({
+                'name': name,
+                'code': code,
+                'account_type': account_type,
+                'reconcile': reconcile,
+            })
+        return account
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.env['account.journal'].create({'name': 'Sale Journal', 'code': 'SALE', 'type': 'sale'})
+        cls.account_income = cls._get_or_create_account('400000', 'Income', 'income')
+        cls.account_receivable = cls._get_or_create_account('120000', 'Receivable', 'asset_receivable', True)
+        cls.partner = cls.env["res.partner"].create({
+            "name": "Test Partner",
+            "property_account_receivable_id": cls.account_receivable.id,
+        })
+        cls.manager_user = cls.env['res.users'].create({
+            'name': 'Plasticos Manager',
+            'login': 'plasticos_compliance_manager_test',
+            'email': 'compliance_manager@example.com',
+            'group_ids': [(6, 0, [
+                cls.env.ref("plasticos_transaction.group_plasticos_manager").id,
+                cls.env.ref("base.group_user").id,
+                cls.env.ref("sales_team.group_sale_manager").id,
+                cls.env.ref("account.group_account_manager").id,
+                cls.env.ref("plasticos_documents.group_documents_user").id,
+            ])],
+        })
+
+        cls.tag_bol, cls.tag_coa, cls.tag_other = cls.env["plasticos.document.tag"].create([
+            {"name": "Bill of Lading", "code": "BOL"},
+            {"name": "Certificate of Analysis", "code": "COA"},
+            {"name": "Other", "code": "OTHER"},
+        ])
+        cls.env["plasticos.document.rule"].create([
+            {"name": "BOL", "tag_id": cls.tag_bol.id, "res_model": "plasticos.transaction"},
+            {"name": "COA", "tag_id": cls.tag_coa.id, "res_model": "plasticos.transaction"},
+            # Inactive rules must not be required.
+            {"name": "Other", "tag_id": cls.tag_other.id, "res_model": "plasticos.transaction",
+             "active": False},
+        ])
+        cls.attachment = cls.env["ir.attachment"].create({"name": "doc.pdf", "raw": b"doc"})
+
+    def _add_document(self, tx, tag, **values):
+        return self.env["plasticos.document"].create({
+            "name": tag.code,
+            "res_model": "plasticos.transaction",
+            "res_id": tx.id,
+            "attachment_id": self.attachment.id,
+            "tag_id": tag.id,
+            **values,
+        })
+
+    def _create_closable_transaction(self):
+        tx = self.env["plasticos.transaction"].create({})
+        invoice = self.env["account.move"].create({
+            "move_type": "out_invoice",
+            "partner_id": self.partner.id,
+            "invoice_line_ids": [(0, 0, {
+                "name": "Revenue",
+                "quantity": 1,
+                "price_unit": 1000,
+                "account_id": self.account_income.id,
+            })],
+        })
+        invoice.action_post()
+        tx.write({"customer_invoice_id": invoice.id})
+        tx.action_activate()
+        return tx
+
+    def test_is_compliant_multi(self):
+        verified, overridden, archived, unverified, missing = (
+            self.env["plasticos.transaction"].create([{} for _ in range(5)])
+        )
+        for tx in (verified, overridden, archived, unverified, missing):
+            self._add_document(tx, self.tag_bol, verified=True)
+        self._add_document(verified, self.tag_coa, verified=True)
+        self._add_document(overridden, self.tag_coa, override=True, override_reason="Waived")
+        self._add_document(archived, self.tag_coa, verified=True, active=False)
+        self._add_document(unverified, self.tag_coa)
+
+        txs = verified | overridden | archived | unverified | missing
+        compliant_ids = self.env["plasticos.compliance.service"].is_compliant_multi(
+            "plasticos.transaction", txs.ids
+        )
+        self.assertEqual(compliant_ids, {verified.id, overridden.id})
+
+    def test_close_blocks_only_non_compliant(self):
+        compliant = self._create_closable_transaction()
+        non_compliant = self._create_closable_transaction()
+        self._add_document(compliant, self.tag_bol, verified=True)
+        self._add_document(compliant, self.tag_coa, verified=True)
+        self._add_document(non_compliant, self.tag_bol, verified=True)
+
+        with self.assertRaisesRegex(UserError, "Required documents missing"):
+            non_compliant.with_user(self.manager_user).action_close()
+        compliant.with_user(self.manager_user).action_close()
+
+        self.assertEqual(compliant.state, "closed")
+        self.assertEqual(non_compliant.state, "active")
+
+    def test_batch_close_with_non_compliant_writes_nothing(self):
+        compliant = self._create_closable_transaction()
+        non_compliant = self._create_closable_transaction()
+        self._add_document(compliant, self.tag_bol, verified=True)
+        self._add_document(compliant, self.tag_coa, verified=True)
+
+        txs = compliant | non_compliant
+        with self.assertRaisesRegex(UserError, "Required documents missing"):
+            txs.with_user(self.manager_user).action_close()
+
+        self.assertEqual(txs.mapped("state"), ["active", "active"])
+        self.assertFalse(any(txs.mapped("commission_locked")))
@@ -4,40 +4,52 @@ from odoo.exceptions import UserError
 
 class TestConcurrency(TransactionCase):
 
-    def setUp(self):
-        super().setUp()
-        self.env['account.journal'].create([
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.env['account.journal'].create([
             {'name': 'Sale Journal', 'code': 'SALE', 'type': 'sale'},
             {'name': 'Purchase Journal', 'code': 'PUR', 'type': 'purchase'},
         ])
-        self.account_receivable = self.env['account.account'].create({
+        cls.account_receivable = cls.env['account.account'].create({
             'name': 'Receivable',
             'code': '120000',
             'account_type': 'asset_receivable',
             'reconcile': True,
         })
-        self.account_payable = self.env['account.account'].create({
+        cls.account_payable = cls.env['account.account'].create({
             'name': 'Payable',
             'code': '210000',
             'account_type': 'liability_payable',
             'reconcile': True,
         })
+        cls.partner = cls.env["res.partner"].create({
+            "name": "Test Partner",
+            "property_account_receivable_id": cls.account_receivable.id,
+            "property_account_payable_id": cls.account_payable.id,
+        })
 
     def test_duplicate_vendor_bill_link(self):
         tx1 = self.env["plasticos.transaction"].create({})
         tx2 = self.env["plasticos.transaction"].create({})
 
-        partner = self.env["res.partner"].create({
-            "name": "Test Partner",
-            "property_account_receivable_id": self.account_receivable.id,
-            "property_account_payable_id": self.account_payable.id,
-        })
         bill = self.env["account.move"].create({
             "move_type": "in_invoice",
-            "partner_id": partner.id,
+            "partner_id": self.partner.id,
         })
 
         tx1.vendor_bill_ids = [(4, bill.id)]
 
         with self.assertRaises(UserError):
             tx2.vendor_bill_ids = [(4, bill.id)]
+
+    def test_duplicate_vendor_bill_link_in_batch(self):
+        txs = self.env["plasticos.transaction"].create([{}, {}])
+
+        bill = self.env["account.move"].create({
+            "move_type": "in_invoice",
+            "partner_id": self.partner.id,
+        })
+
+        with self.assertRaises(UserError):
+            txs.write({"vendor_bill_ids": [(4, bill.id)]})
@@ -5,10 +5,11 @@ import hashlib
 
 class TestDeterministicReplay(TransactionCase):
 
-    def _get_or_create_account(self, code, name, account_type, reconcile=False):
-        account = self.env['account.account'].search([('code', '=', code)], limit=1)
+    @classmethod
+    def _get_or_create_account(cls, code, name, account_type, reconcile=False):
+        account = cls.env['account.account'].search([('code', '=', code)], limit=1)
         if not account:
-            account = self.env['account.account'].create({
+            account = cls.env['account.account'].create({
                 'name': name,
                 'code': code,
                 'account_type': account_type,
@@ -16,37 +17,38 @@ class TestDeterministicReplay(TransactionCase):
             })
         return account
 
-    def setUp(self):
-        super().setUp()
-        self.env['account.journal'].create([
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.env['account.journal'].create([
             {'name': 'Sale Journal', 'code': 'SALE', 'type': 'sale'},
             {'name': 'Purchase Journal', 'code': 'PUR', 'type': 'purchase'},
         ])
-        self.account_income = self._get_or_create_account('400000', 'Income', 'income')
-        self.account_expense = self._get_or_create_account('600000', 'Expense', 'expense')
-        self.account_receivable = self._get_or_create_account('120000', 'Receivable', 'asset_receivable', True)
-        self.account_payable = self._get_or_create_account('210000', 'Payable', 'liability_payable', True)
-        
+        cls.account_income = cls._get_or_create_account('400000', 'Income', 'income')
+        cls.account_expense = cls._get_or_create_account('600000', 'Expense', 'expense')
+        cls.account_receivable = cls._get_or_create_account('120000', 'Receivable', 'asset_receivable', True)
+        cls.account_payable = cls._get_or_create_account('210000', 'Payable', 'liability_payable', True)
+
         # Create a manager user and switch to it
-        group_manager = self.env.ref("plasticos_transaction.group_plasticos_manager")
-        group_user = self.env.ref("base.group_user")
-        group_sale_manager = self.env.ref("sales_team.group_sale_manager")
-        group_account_manager = self.env.ref("account.group_account_manager")
-        group_documents_user = self.env.ref("plasticos_documents.group_documents_user")
-        
-        self.manager_user = self.env['res.users'].create({
+        group_manager = cls.env.ref("plasticos_transaction.group_plasticos_manager")
+        group_user = cls.env.ref("base.group_user")
+        group_sale_manager = cls.env.ref("sales_team.group_sale_manager")
+        group_account_manager = cls.env.ref("account.group_account_manager")
+        group_documents_user = cls.env.ref("plasticos_documents.group_documents_user")
+
+        cls.manager_user = cls.env['res.users'].create({
             'name': 'Plasticos Manager',
             'login': 'plasticos_manager_test',
             'email': 'manager@example.com',
             'group_ids': [(6, 0, [
-                group_manager.id, 
+                group_manager.id,
                 group_user.id,
                 group_sale_manager.id,
                 group_account_manager.id,
                 group_documents_user.id
             ])],
         })
-        self.env = self.env(user=self.manager_user)
+        cls.env = cls.env(user=cls.manager_user)
 
     def _snapshot_hash(self, tx):
         payload = (
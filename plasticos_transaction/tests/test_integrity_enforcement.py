@@ -1,14 +1,15 @@
 from odoo.tests.common import TransactionCase
-from odoo.exceptions import UserError
+from odoo.exceptions import UserError, ValidationError
 from odoo import fields
 
 
 class TestIntegrity(TransactionCase):
 
-    def _get_or_create_account(self, code, name, account_type, reconcile=False):
-        account = self.env['account.account'].search([('code', '=', code)], limit=1)
+    @classmethod
+    def _get_or_create_account(cls, code, name, account_type, reconcile=False):
+        account = cls.env['account.account'].search([('code', '=', code)], limit=1)
         if not account:
-            account = self.env['account.account'].create({
+            account = cls.env['account.account'].create({
                 'name': name,
                 'code': code,
                 'account_type': account_type,
@@ -16,71 +17,74 @@ class TestIntegrity(TransactionCase):
             })
         return account
 
-    def setUp(self):
-        super().setUp()
-        self.env['account.journal'].create([
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.env['account.journal'].create([
             {'name': 'Sale Journal', 'code': 'SALE', 'type': 'sale'},
             {'name': 'Purchase Journal', 'code': 'PUR', 'type': 'purchase'},
         ])
-        self.account_income = self._get_or_create_account('400000', 'Income', 'income')
-        self.account_expense = self._get_or_create_account('600000', 'Expense', 'expense')
-        self.account_receivable = self._get_or_create_account('120000', 'Receivable', 'asset_receivable', True)
-        self.account_payable = self._get_or_create_account('210000', 'Payable', 'liability_payable', True)
-        self.partner = self.env["res.partner"].create({
+        cls.account_income = cls._get_or_create_account('400000', 'Income', 'income')
+        cls.account_expense = cls._get_or_create_account('600000', 'Expense', 'expense')
+        cls.account_receivable = cls._get_or_create_account('120000', 'Receivable', 'asset_receivable', True)
+        cls.account_payable = cls._get_or_create_account('210000', 'Payable', 'liability_payable', True)
+        cls.partner = cls.env["res.partner"].create({
             "name": "Test Partner",
-            "property_account_receivable_id": self.account_receivable.id,
-            "property_account_payable_id": self.account_payable.id,
+            "property_account_receivable_id": cls.account_receivable.id,
+            "property_account_payable_id": cls.account_payable.id,
         })
 
         # Create a manager user and switch to it
-        group_manager = self.env.ref("plasticos_transaction.group_plasticos_manager")
-        group_user = self.env.ref("base.group_user")
-        group_sale_manager = self.env.ref("sales_team.group_sale_manager")
-        group_account_manager = self.env.ref("account.group_account_manager")
-        group_documents_user = self.env.ref("plasticos_documents.group_documents_user")
+        group_manager = cls.env.ref("plasticos_transaction.group_plasticos_manager")
+        group_user = cls.env.ref("base.group_user")
+        group_sale_manager = cls.env.ref("sales_team.group_sale_manager")
+        group_account_manager = cls.env.ref("account.group_account_manager")
+        group_documents_user = cls.env.ref("plasticos_documents.group_documents_user")
 
-        self.manager_user = self.env['res.users'].create({
+        cls.manager_user = cls.env['res.users'].create({
             'name': 'Plasticos Manager',
             'login': 'plasticos_manager_test',
             'email': 'manager@example.com',
             'group_ids': [(6, 0, [
-                group_manager.id, 
+                group_manager.id,
                 group_user.id,
                 group_sale_manager.id,
                 group_account_manager.id,
                 group_documents_user.id
             ])],
         })
-        self.env = self.env(user=self.manager_user)
+        cls.env = cls.env(user=cls.manager_user)
 
-    def _create_closed_transaction(self):
-        tx = self.env["plasticos.transaction"].create({})
-        invoice = self.env["account.move"].create({
+    def _link_posted_moves(self, tx, revenue, cost):
+        invoice, bill = self.env["account.move"].create([{
             "move_type": "out_invoice",
             "partner_id": self.partner.id,
             "invoice_line_ids": [(0, 0, {
                 "name": "Revenue",
                 "quantity": 1,
-                "price_unit": 1000,
+                "price_unit": revenue,
                 "account_id": self.account_income.id,
             })],
-        })
-        invoice.action_post()
-        tx.customer_invoice_id = invoice.id
-
-        bill = self.env["account.move"].create({
+        }, {
             "move_type": "in_invoice",
             "partner_id": self.partner.id,
             "invoice_date": fields.Date.today(),
             "invoice_line_ids": [(0, 0, {
                 "name": "Cost",
                 "quantity": 1,
-                "price_unit": 400,
+                "price_unit": cost,
                 "account_id": self.account_expense.id,
             })],
+        }])
+        (invoice | bill).action_post()
+        tx.write({
+            "customer_invoice_id": invoice.id,
+            "vendor_bill_ids": [(4, bill.id)],
         })
-        bill.action_post()
-        tx.vendor_bill_ids = [(4, bill.id)]
+
+    def _create_closed_transaction(self):
+        tx = self.env["plasticos.transaction"].create({})
+        self._link_posted_moves(tx, 1000, 400)
 
         tx.action_activate()
         tx.action_close()
@@ -102,33 +106,20 @@ class TestIntegrity(TransactionCase):
 
     def test_negative_margin_block(self):
         tx = self.env["plasticos.transaction"].create({})
-        invoice = self.env["account.move"].create({
-            "move_type": "out_invoice",
-            "partner_id": self.partner.id,
-            "invoice_line_ids": [(0, 0, {
-                "name": "Revenue",
-                "quantity": 1,
-                "price_unit": 100,
-                "account_id": self.account_income.id,
-            })],
-        })
-        invoice.action_post()
-        tx.customer_invoice_id = invoice.id
-
-        bill = self.env["account.move"].create({
-            "move_type": "in_invoice",
-            "partner_id": self.partner.id,
-            "invoice_date": fields.Date.today(),
-            "invoice_line_ids": [(0, 0, {
-                "name": "Cost",
-                "quantity": 1,
-                "price_unit": 200,
-                "account_id": self.account_expense.id,
-            })],
-        })
-        bill.action_post()
-        tx.vendor_bill_ids = [(4, bill.id)]
+        self._link_posted_moves(tx, 100, 200)
 
         tx.action_activate()
         with self.assertRaises(UserError):
             tx.action_close()
+
+    def test_move_type_mismatch_rejected(self):
+        tx = self.env["plasticos.transaction"].create({})
+        bill, invoice = self.env["account.move"].create([
+            {"move_type": "in_invoice", "partner_id": self.partner.id},
+            {"move_type": "out_invoice", "partner_id": self.partner.id},
+        ])
+
+        with self.assertRaises(ValidationError):
+            tx.write({"customer_invoice_id": bill.id})
+        with self.assertRaises(ValidationError):
+            tx.write({"vendor_bill_ids": [(4, invoice.id)]})
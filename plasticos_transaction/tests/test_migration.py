@@ -9,7 +9,8 @@ class TestMigrationValidation(TransactionCase):
             FROM plasticos_transaction
             WHERE customer_invoice_id IS NOT NULL
             GROUP BY customer_invoice_id
-            HAVING COUNT(*) > 1;
+            HAVING COUNT(*) > 1
+            LIMIT 1;
         """)
         rows = self.env.cr.fetchall()
         self.assertFalse(rows, "Duplicate customer_invoice_id links must not exist.")
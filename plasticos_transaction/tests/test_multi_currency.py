@@ -3,18 +3,49 @@ from odoo.tests.common import TransactionCase
 
 class TestMultiCurrency(TransactionCase):
 
-    def test_margin_computation_multi_currency(self):
-        currency = self.env.ref("base.EUR")
-        partner = self.env.ref("base.res_partner_1")
+    @classmethod
+    def _get_or_create_account(cls, code, name, account_type, reconcile=False):
+        account = cls.env['account.account'].search([('code', '=', code)], limit=1)
+        if not account:
+            account = cls.env['account.account'].create({
+                'name': name,
+                'code': code,
+                'account_type': account_type,
+                'reconcile': reconcile,
+            })
+        return account
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.currency = cls.env.ref("base.EUR")
+        cls.currency.active = True
+        cls.env['account.journal'].create({'name': 'Sale Journal', 'code': 'SALE', 'type': 'sale'})
+        cls.account_income = cls._get_or_create_account('400000', 'Income', 'income')
+        cls.account_receivable = cls._get_or_create_account('120000', 'Receivable', 'asset_receivable', True)
+        cls.partner = cls.env["res.partner"].create({
+            "name": "Test Partner",
+            "property_account_receivable_id": cls.account_receivable.id,
+        })
 
+    def test_margin_computation_multi_currency(self):
         invoice = self.env["account.move"].create({
             "move_type": "out_invoice",
-            "partner_id": partner.id,
-            "currency_id": currency.id,
+            "partner_id": self.partner.id,
+            "currency_id": self.currency.id,
+            "invoice_line_ids": [(0, 0, {
+                "name": "Revenue",
+                "quantity": 1,
+                "price_unit": 1000,
+                "account_id": self.account_income.id,
+            })],
         })
 
         tx = self.env["plasticos.transaction"].create({
             "customer_invoice_id": invoice.id,
         })
 
-        self.assertIsNotNone(tx.gross_margin)
+        values = tx.read(["gross_margin", "revenue_total"])[0]
+        self.assertTrue(invoice.amount_total)
+        self.assertEqual(values["revenue_total"], invoice.amount_total)
+        self.assertEqual(values["gross_margin"], values["revenue_total"])
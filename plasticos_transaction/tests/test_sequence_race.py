@@ -1,11 +1,21 @@
 from odoo.tests.common import TransactionCase
+from odoo import fields
+import re
 
 
 class TestSequenceRace(TransactionCase):
 
     def test_sequence_unique_under_flush(self):
-        txs = []
-        for _ in range(20):
-            txs.append(self.env["plasticos.transaction"].create({}))
-        names = [t.name for t in txs]
+        txs = self.env["plasticos.transaction"].create([{} for _ in range(20)])
+        names = txs.mapped("name")
         self.assertEqual(len(names), len(set(names)), "Transaction names must be unique.")
+
+    def test_batch_names_are_consecutive(self):
+        txs = self.env["plasticos.transaction"].create([{} for _ in range(5)])
+        pattern = re.compile(r"^TRX-%d-(\d{6})$" % fields.Date.today().year)
+        numbers = []
+        for name in txs.mapped("name"):
+            match = pattern.match(name)
+            self.assertTrue(match, f"Unexpected transaction name {name!r}.")
+            numbers.append(int(match.group(1)))
+        self.assertEqual(numbers, list(range(numbers[0], numbers[0] + 5)))